@@ -1,21 +1,194 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.security import APIKeyHeader
+from starlette.datastructures import Headers, MutableHeaders
 from pydantic import BaseModel
 from typing import Optional, List
 import uvicorn
 import os
+import sys
+import time
+import hmac
+import asyncio
+import hashlib
+import zlib
+import random
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 import jwt
 import bcrypt
-from pymongo import MongoClient
+from pymongo import MongoClient, monitoring
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 import uuid
 from openai import OpenAI
 import json
 import re
+import numpy as np
+
+# Profiling settings
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+SLOW_REQUEST_BUFFER_SIZE = int(os.getenv("SLOW_REQUEST_BUFFER_SIZE", "50"))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5"))
+
+# Request profiling
+current_profile = ContextVar("current_profile", default=None)
+slow_requests = deque(maxlen=SLOW_REQUEST_BUFFER_SIZE)
+
+class RequestProfile:
+    """Span timings and sampled stacks collected for one profiled request"""
+    def __init__(self, method: str, path: str, forced: bool):
+        self.id = str(uuid.uuid4())
+        self.method = method
+        self.path = path
+        self.forced = forced
+        self.started_at = datetime.utcnow()
+        self.start = time.perf_counter()
+        self.spans = []
+        self.stacks = Counter()
+        # The event loop thread is shared by every request, so its samples only
+        # count when this request's middleware frame is on the stack
+        self.loop_thread_id = threading.get_ident()
+        self.root_frame = None
+        # Other threads count only while a span or MongoDB command of this request runs on them
+        self.active_threads = Counter()
+        self.lock = threading.Lock()
+    
+    def enter_thread(self):
+        with self.lock:
+            self.active_threads[threading.get_ident()] += 1
+    
+    def exit_thread(self):
+        thread_id = threading.get_ident()
+        with self.lock:
+            self.active_threads[thread_id] -= 1
+            if self.active_threads[thread_id] <= 0:
+                del self.active_threads[thread_id]
+    
+    def sampled_thread_ids(self):
+        with self.lock:
+            return {self.loop_thread_id} | set(self.active_threads)
+    
+    def add_span(self, name: str, start: float, end: float):
+        self.spans.append({
+            "name": name,
+            "start_ms": round((start - self.start) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3)
+        })
+    
+    def to_dict(self, status_code: int, duration_ms: float):
+        # Group span time by category prefix, e.g. "mongo.find" -> "mongo"
+        span_totals = Counter()
+        for span_entry in self.spans:
+            span_totals[span_entry["name"].split(".")[0]] += span_entry["duration_ms"]
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 3),
+            "started_at": self.started_at.isoformat(),
+            "forced": self.forced,
+            "spans": self.spans,
+            "span_totals": {name: round(total, 3) for name, total in span_totals.items()},
+            # Folded "frame;frame;frame count" lines, ready for flamegraph tools
+            "stacks": [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        }
+
+@contextmanager
+def span(name: str):
+    """Time a block of work against the current request profile, if any"""
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+    profile.enter_thread()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_span(name, start, time.perf_counter())
+        profile.exit_thread()
+
+class StackSampler(threading.Thread):
+    """Periodically sample the stacks of threads working on a profiled request"""
+    def __init__(self, profile: RequestProfile):
+        super().__init__(daemon=True)
+        self.profile = profile
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        interval = PROFILE_SAMPLE_INTERVAL_MS / 1000
+        while not self.stop_event.wait(interval):
+            frames = sys._current_frames()
+            for thread_id in self.profile.sampled_thread_ids():
+                stack = self.sample_stack(thread_id, frames.get(thread_id))
+                if stack:
+                    self.profile.stacks[";".join(reversed(stack))] += 1
+    
+    def sample_stack(self, thread_id: int, frame):
+        """Return the frames of one thread, innermost first, or None if not working on this request"""
+        on_loop_thread = thread_id == self.profile.loop_thread_id
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            if on_loop_thread and frame is self.profile.root_frame:
+                # Everything above the middleware belongs to the server, not this request
+                return stack
+            frame = frame.f_back
+        return None if on_loop_thread else stack
+    
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+class MongoSpanListener(monitoring.CommandListener):
+    """Record every MongoDB command as a span on the current request profile"""
+    def __init__(self):
+        self.pending = {}
+    
+    def started(self, event):
+        profile = current_profile.get()
+        if profile is None:
+            return
+        collection = event.command.get(event.command_name)
+        name = f"mongo.{event.command_name}"
+        if isinstance(collection, str):
+            name = f"{name} {collection}"
+        profile.enter_thread()
+        self.pending[event.request_id] = (profile, name, time.perf_counter())
+    
+    def succeeded(self, event):
+        self._finish(event)
+    
+    def failed(self, event):
+        self._finish(event)
+    
+    def _finish(self, event):
+        pending = self.pending.pop(event.request_id, None)
+        if pending:
+            profile, name, start = pending
+            profile.add_span(name, start, time.perf_counter())
+            profile.exit_thread()
+
+class ProfiledJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
 
 # Initialize FastAPI app
-app = FastAPI(title="SaaS Blueprint Generator API", version="1.0.0")
+app = FastAPI(
+    title="SaaS Blueprint Generator API",
+    version="1.0.0",
+    default_response_class=ProfiledJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -26,9 +199,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Profiling middleware
+class ProfilingMiddleware:
+    """Profile sampled or admin-requested requests and keep the slow ones.
+    
+    A plain ASGI middleware rather than @app.middleware, so the request runs in
+    this coroutine and its frame marks the request's samples on the event loop.
+    """
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        forced = is_admin_token(headers.get("X-Profile"))
+        if not forced and random.random() >= PROFILE_SAMPLE_RATE:
+            await self.app(scope, receive, send)
+            return
+        
+        profile = RequestProfile(scope["method"], scope["path"], forced)
+        profile.root_frame = sys._getframe()
+        status_code = 500
+        
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Profile-Id"] = profile.id
+            await send(message)
+        
+        context_token = current_profile.set(profile)
+        sampler = StackSampler(profile)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            current_profile.reset(context_token)
+            profile.root_frame = None
+            duration_ms = (time.perf_counter() - profile.start) * 1000
+            if forced or duration_ms >= SLOW_REQUEST_MS:
+                slow_requests.append(profile.to_dict(status_code, duration_ms))
+
+app.add_middleware(ProfilingMiddleware)
+
 # MongoDB setup
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/saas_blueprint")
-client = MongoClient(MONGO_URL)
+client = MongoClient(MONGO_URL, event_listeners=[MongoSpanListener()])
 db = client.saas_blueprint
 
 # Collections
@@ -36,18 +255,47 @@ users_collection = db.users
 projects_collection = db.projects
 tasks_collection = db.tasks
 flows_collection = db.flows
+idempotency_collection = db.idempotency_keys
+dashboard_rollups_collection = db.dashboard_rollups
 
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Bulk export/import settings
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "100"))
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+MAX_IMPORT_LINE_BYTES = int(os.getenv("MAX_IMPORT_LINE_BYTES", str(1024 * 1024)))
+
+# Idempotency settings
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "60"))
+IDEMPOTENCY_LEASE_SECONDS = int(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "120"))
+IDEMPOTENCY_POLL_INTERVAL_SECONDS = 0.25
+
+# Similar idea detection settings
+SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", "0.6"))
+SIMILARITY_SNAPSHOT_PATH = os.getenv("SIMILARITY_SNAPSHOT_PATH", "similarity_index.json")
+SIMILARITY_SNAPSHOT_INTERVAL_SECONDS = int(os.getenv("SIMILARITY_SNAPSHOT_INTERVAL_SECONDS", "300"))
+MINHASH_BANDS = 32
+MINHASH_ROWS = 4
+MINHASH_MAX_SHINGLES = 1000
+SIMILARITY_LOAD_BATCH_SIZE = 1000
+
+# Dashboard rollup settings
+DASHBOARD_RECENT_PROJECTS = 5
+DASHBOARD_RECENT_ACTIVITY = 20
+DASHBOARD_REBUILD_ATTEMPTS = 3
+
 # OpenAI setup
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+openai_client = OpenAI(api_key=OPENAI_API_KEY, timeout=OPENAI_TIMEOUT_SECONDS) if OPENAI_API_KEY else None
 
 # Security
 security = HTTPBearer()
+admin_token_header = APIKeyHeader(name="X-Admin-Token", auto_error=False)
 
 # Pydantic models
 class UserCreate(BaseModel):
@@ -62,6 +310,7 @@ class UserLogin(BaseModel):
 class ProjectCreate(BaseModel):
     title: str
     description: str
+    reuse_analysis: bool = True
 
 class TaskCreate(BaseModel):
     title: str
@@ -73,10 +322,19 @@ class TaskUpdate(BaseModel):
 
 # Helper functions
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    with span("auth.bcrypt_hash"):
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    with span("auth.bcrypt_verify"):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+def is_admin_token(token: Optional[str]) -> bool:
+    return bool(ADMIN_TOKEN and token and hmac.compare_digest(token, ADMIN_TOKEN))
+
+def require_admin(token: Optional[str] = Depends(admin_token_header)):
+    if not is_admin_token(token):
+        raise HTTPException(status_code=403, detail="Admin access required")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -89,31 +347,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+    with span("auth.current_user"):
+        try:
+            payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+            email: str = payload.get("sub")
+            if email is None:
+                raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+            user = users_collection.find_one({"email": email})
+            if user is None:
+                raise HTTPException(status_code=401, detail="User not found")
+            return user
+        except jwt.PyJWTError:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        user = users_collection.find_one({"email": email})
-        if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
-    except jwt.PyJWTError:
-        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
 def analyze_idea_with_ai(idea_description: str):
     """Analyze SaaS idea using OpenAI API or mock analysis"""
     if openai_client and OPENAI_API_KEY:
         try:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert SaaS consultant. Analyze the given SaaS idea and provide feedback on Market Need (1-10), Technical Feasibility (1-10), and User Value (1-10). Also provide constructive feedback and suggestions."},
-                    {"role": "user", "content": f"Please analyze this SaaS idea: {idea_description}"}
-                ],
-                max_tokens=500,
-                temperature=0.7
-            )
+            with span("llm.analyze_idea"):
+                response = openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": "You are an expert SaaS consultant. Analyze the given SaaS idea and provide feedback on Market Need (1-10), Technical Feasibility (1-10), and User Value (1-10). Also provide constructive feedback and suggestions."},
+                        {"role": "user", "content": f"Please analyze this SaaS idea: {idea_description}"}
+                    ],
+                    max_tokens=500,
+                    temperature=0.7
+                )
             return response.choices[0].message.content
         except Exception as e:
             print(f"OpenAI API error: {e}")
@@ -219,7 +479,672 @@ def convert_features_to_tasks(features: List[str]):
     
     return tasks
 
+class SimilarityIndex:
+    """MinHash/LSH index of project descriptions for near-duplicate lookups.
+    
+    Signatures live in memory and are written to a JSON snapshot periodically,
+    so a restart only has to index projects missing from the last snapshot.
+    """
+    SCHEME = "minhash-numpy-crc32-v1"
+    MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+    MAX_HASH = np.uint64((1 << 32) - 1)
+    STOP_WORDS = {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into",
+        "is", "it", "its", "of", "on", "or", "that", "the", "their", "this", "to",
+        "which", "with", "will"
+    }
+    
+    def __init__(self, bands: int, rows: int, max_shingles: int):
+        self.bands = bands
+        self.rows = rows
+        self.max_shingles = max_shingles
+        # Fixed seed keeps signatures comparable across snapshots and restarts
+        rng = np.random.RandomState(42)
+        size = bands * rows
+        self.perm_a = rng.randint(1, self.MERSENNE_PRIME, size=size, dtype=np.uint64)[:, None]
+        self.perm_b = rng.randint(0, self.MERSENNE_PRIME, size=size, dtype=np.uint64)[:, None]
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.buckets = {}
+    
+    def shingles(self, text: str):
+        words = [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in self.STOP_WORDS]
+        return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+    
+    def signature(self, text: str):
+        if not isinstance(text, str):
+            return None
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        # crc32 is stable across processes, unlike hash(), and cheap enough for long texts
+        hashes = np.sort(np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        ))
+        # Keep the smallest distinct shingle hashes: a consistent sample, so long texts stay comparable
+        hashes = hashes[np.concatenate(([True], hashes[1:] != hashes[:-1]))][:self.max_shingles]
+        # All permutations at once; uint64 arithmetic wraps, as in standard MinHash implementations
+        permuted = ((self.perm_a * hashes + self.perm_b) % self.MERSENNE_PRIME) & self.MAX_HASH
+        return permuted.min(axis=1)
+    
+    def band_keys(self, user_id: str, signature: np.ndarray):
+        for band in range(self.bands):
+            yield (user_id, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+    
+    def add_signature(self, project_id: str, user_id: str, signature: np.ndarray):
+        with self.lock:
+            if project_id in self.entries:
+                self.remove(project_id)
+            self.entries[project_id] = (user_id, signature)
+            for key in self.band_keys(user_id, signature):
+                self.buckets.setdefault(key, set()).add(project_id)
+    
+    def add(self, project_id: str, user_id: str, description: str):
+        signature = self.signature(description)
+        if signature is not None:
+            self.add_signature(project_id, user_id, signature)
+    
+    def find_similar(self, user_id: str, signature: np.ndarray):
+        """Return (project_id, similarity) of the closest indexed project above the threshold"""
+        with self.lock:
+            candidates = set()
+            for key in self.band_keys(user_id, signature):
+                candidates |= self.buckets.get(key, set())
+            best = None
+            for project_id in candidates:
+                other = self.entries[project_id][1]
+                similarity = float(np.count_nonzero(signature == other) / signature.size)
+                if similarity >= SIMILARITY_THRESHOLD and (best is None or similarity > best[1]):
+                    best = (project_id, similarity)
+        return best
+    
+    def save_snapshot(self, path: str):
+        with self.lock:
+            snapshot = {
+                "scheme": self.SCHEME,
+                "taken_at": datetime.utcnow().isoformat(),
+                "entries": {pid: [uid, sig.tolist()] for pid, (uid, sig) in self.entries.items()}
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    
+    def load(self, path: str):
+        """Load the last snapshot, then index projects whose ids it is missing"""
+        snapshot_ids = set()
+        snapshot = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError) as e:
+                # Rebuild everything from the projects collection below
+                print(f"Similarity index snapshot unreadable, rebuilding: {e}")
+        if isinstance(snapshot, dict) and snapshot.get("scheme") == self.SCHEME:
+            # Signatures from another scheme are not comparable; recompute them instead
+            entries = snapshot.get("entries")
+            if not isinstance(entries, dict):
+                entries = {}
+            for project_id, entry in entries.items():
+                if not isinstance(entry, list) or len(entry) != 2:
+                    continue
+                user_id, signature = entry
+                if not isinstance(signature, list) or len(signature) != self.bands * self.rows:
+                    continue
+                try:
+                    signature = np.array(signature, dtype=np.uint64)
+                except (TypeError, ValueError, OverflowError):
+                    continue
+                self.add_signature(project_id, user_id, signature)
+                snapshot_ids.add(project_id)
+        
+        # Reconcile by id rather than created_at, since imports keep historical timestamps
+        seen = set()
+        missing = []
+        for project in projects_collection.find({}, {"_id": 0, "id": 1}):
+            seen.add(project["id"])
+            if project["id"] not in self.entries:
+                missing.append(project["id"])
+            if len(missing) >= SIMILARITY_LOAD_BATCH_SIZE:
+                self.index_projects(missing)
+                missing = []
+        self.index_projects(missing)
+        
+        # Only prune snapshot entries; projects created during the scan were indexed live
+        with self.lock:
+            for project_id in snapshot_ids - seen:
+                if project_id in self.entries:
+                    self.remove(project_id)
+    
+    def index_projects(self, project_ids: List[str]):
+        if not project_ids:
+            return
+        projection = {"id": 1, "user_id": 1, "description": 1}
+        for project in projects_collection.find({"id": {"$in": project_ids}}, projection):
+            # Descriptions that cannot be indexed are skipped, never fatal
+            self.add(project["id"], project.get("user_id"), project.get("description"))
+    
+    def remove(self, project_id: str):
+        """Drop an entry; the caller must hold the lock"""
+        user_id, signature = self.entries.pop(project_id)
+        for key in self.band_keys(user_id, signature):
+            bucket = self.buckets.get(key)
+            if bucket:
+                bucket.discard(project_id)
+                if not bucket:
+                    del self.buckets[key]
+
+similarity_index = SimilarityIndex(MINHASH_BANDS, MINHASH_ROWS, MINHASH_MAX_SHINGLES)
+
+def snapshot_similarity_index():
+    try:
+        similarity_index.save_snapshot(SIMILARITY_SNAPSHOT_PATH)
+    except OSError as e:
+        print(f"Similarity index snapshot error: {e}")
+
+def schedule_similarity_snapshots():
+    timer = threading.Timer(SIMILARITY_SNAPSHOT_INTERVAL_SECONDS, run_scheduled_snapshot)
+    timer.daemon = True
+    timer.start()
+
+def run_similarity_backfill():
+    similarity_index.load(SIMILARITY_SNAPSHOT_PATH)
+    schedule_similarity_snapshots()
+
+def run_scheduled_snapshot():
+    snapshot_similarity_index()
+    schedule_similarity_snapshots()
+
+def serialize_document(doc: dict):
+    """Strip the MongoDB _id and convert datetimes for JSON output"""
+    doc.pop("_id", None)
+    if isinstance(doc.get("created_at"), datetime):
+        doc["created_at"] = doc["created_at"].isoformat()
+    return doc
+
+def parse_created_at(value):
+    """Parse an exported created_at value, defaulting to now"""
+    if not value:
+        return datetime.utcnow()
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid created_at value: {value!r}")
+
+def is_non_empty_string(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+def build_import_documents(record: dict, user_id: str):
+    """Build project and task documents from one exported NDJSON record"""
+    if not isinstance(record, dict):
+        raise ValueError("Record must be a JSON object")
+    if not is_non_empty_string(record.get("title")) or not is_non_empty_string(record.get("description")):
+        raise ValueError("Project title and description must be non-empty strings")
+    if not isinstance(record.get("status", "active"), str):
+        raise ValueError("Project status must be a string")
+    if not isinstance(record.get("validation_scores") or {}, dict):
+        raise ValueError("Project validation_scores must be an object")
+    features = record.get("features") or []
+    if not isinstance(features, list) or not all(isinstance(f, str) for f in features):
+        raise ValueError("Project features must be a list of strings")
+    tasks = record.get("tasks") or []
+    if not isinstance(tasks, list):
+        raise ValueError("Project tasks must be a list")
+    
+    # Imported records always get fresh ids owned by the importing user
+    project_id = str(uuid.uuid4())
+    project_doc = {
+        "id": project_id,
+        "user_id": user_id,
+        "title": record["title"],
+        "description": record["description"],
+        "validation_scores": record.get("validation_scores") or {},
+        "features": features,
+        "status": record.get("status", "active"),
+        "created_at": parse_created_at(record.get("created_at"))
+    }
+    if "analysis" in record:
+        project_doc["analysis"] = record["analysis"]
+    
+    task_docs = []
+    for task in tasks:
+        if not isinstance(task, dict) or not is_non_empty_string(task.get("title")):
+            raise ValueError("Every task must be an object with a non-empty string title")
+        for field, default in (("description", ""), ("priority", "Medium"), ("status", "To Do")):
+            if not isinstance(task.get(field, default), str):
+                raise ValueError(f"Task {field} must be a string")
+        task_docs.append({
+            "id": str(uuid.uuid4()),
+            "project_id": project_id,
+            "title": task["title"],
+            "description": task.get("description", ""),
+            "priority": task.get("priority", "Medium"),
+            "status": task.get("status", "To Do"),
+            "created_at": parse_created_at(task.get("created_at"))
+        })
+    
+    return project_doc, task_docs
+
+def rollup_key(value: str) -> str:
+    """Make a status or priority value safe to use as a MongoDB field name"""
+    return str(value).replace(".", "_").lstrip("$") or "_"
+
+def activity_entry(activity_type: str, project: dict, **extra):
+    return {
+        "type": activity_type,
+        "project_id": project["id"],
+        "title": project["title"],
+        "at": datetime.utcnow(),
+        **extra
+    }
+
+def recent_project_summary(project: dict, task_count: int, completed_tasks: int):
+    return {
+        "id": project["id"],
+        "title": project["title"],
+        "description": project["description"][:200],
+        "task_count": task_count,
+        "completed_tasks": completed_tasks,
+        "created_at": project["created_at"]
+    }
+
+def read_dashboard_generation(user_id: str):
+    """Read the rollup's generation; callers do this before changing the source data"""
+    return dashboard_rollups_collection.find_one({"_id": user_id}, {"generation": 1})
+
+def update_dashboard_rollup(user_id: str, snapshot: Optional[dict], update: dict, activity: Optional[dict] = None, array_filters=None):
+    """Apply an incremental change to a user's rollup, or rebuild it if the change may already be counted.
+    
+    snapshot is the result of read_dashboard_generation taken before the source
+    write. The change is applied only while the rollup still has that generation;
+    a rebuild that replaced it in between may or may not have seen the source
+    write, so the rollup is rebuilt again instead of double-counting or dropping it.
+    """
+    if snapshot is None:
+        # No rollup existed before the write, so build it now rather than race a first build
+        rebuild_dashboard_rollup(user_id, activity)
+        return
+    update.setdefault("$set", {})["updated_at"] = datetime.utcnow()
+    # The version lets a concurrent rebuild detect that it would overwrite this change
+    update.setdefault("$inc", {})["version"] = 1
+    if activity:
+        update.setdefault("$push", {})["recent_activity"] = {
+            "$each": [activity], "$position": 0, "$slice": DASHBOARD_RECENT_ACTIVITY
+        }
+    generation_filter = snapshot["generation"] if "generation" in snapshot else {"$exists": False}
+    result = dashboard_rollups_collection.update_one(
+        {"_id": user_id, "generation": generation_filter}, update, array_filters=array_filters
+    )
+    if not result.matched_count:
+        rebuild_dashboard_rollup(user_id, activity)
+
+def rebuild_dashboard_rollup(user_id: str, activity: Optional[dict] = None):
+    """Recompute a user's dashboard rollup from the projects and tasks collections.
+    
+    The rollup is replaced only if its version is unchanged since the rebuild
+    started, so incremental writes that land mid-rebuild trigger a retry instead
+    of being lost. Each rebuild stores a new generation, which incremental writes
+    check so they never re-apply a change the rebuild already counted. Only the
+    fallback after repeated version conflicts can drop a concurrent change; the
+    next rebuild corrects it.
+    """
+    for _ in range(DASHBOARD_REBUILD_ATTEMPTS):
+        # Read the version before the source data so any later write changes it
+        existing = dashboard_rollups_collection.find_one({"_id": user_id}, {"recent_activity": 1, "version": 1})
+        rollup = compute_dashboard_rollup(user_id, existing, activity)
+        if existing is None:
+            try:
+                dashboard_rollups_collection.insert_one(rollup)
+                return rollup
+            except DuplicateKeyError:
+                continue
+        version_filter = existing["version"] if "version" in existing else {"$exists": False}
+        result = dashboard_rollups_collection.replace_one({"_id": user_id, "version": version_filter}, rollup)
+        if result.matched_count:
+            return rollup
+    
+    # Under sustained writes, fall back to the latest full computation
+    rollup = compute_dashboard_rollup(user_id, existing, activity)
+    dashboard_rollups_collection.replace_one({"_id": user_id}, rollup, upsert=True)
+    return rollup
+
+def compute_dashboard_rollup(user_id: str, existing: Optional[dict], activity: Optional[dict] = None):
+    tasks_by_status = Counter()
+    tasks_by_priority = Counter()
+    breakdown = projects_collection.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$lookup": {
+            "from": tasks_collection.name,
+            "localField": "id",
+            "foreignField": "project_id",
+            "as": "tasks"
+        }},
+        {"$unwind": "$tasks"},
+        {"$group": {
+            "_id": {"status": "$tasks.status", "priority": "$tasks.priority"},
+            "count": {"$sum": 1}
+        }}
+    ])
+    completed_tasks = 0
+    for group in breakdown:
+        tasks_by_status[rollup_key(group["_id"].get("status"))] += group["count"]
+        tasks_by_priority[rollup_key(group["_id"].get("priority"))] += group["count"]
+        if group["_id"].get("status") == "Done":
+            completed_tasks += group["count"]
+    
+    recent_projects = []
+    latest = projects_collection.find({"user_id": user_id}).sort("created_at", -1).limit(DASHBOARD_RECENT_PROJECTS)
+    for project in latest:
+        recent_projects.append(recent_project_summary(
+            project,
+            tasks_collection.count_documents({"project_id": project["id"]}),
+            tasks_collection.count_documents({"project_id": project["id"], "status": "Done"})
+        ))
+    
+    # Activity history is not derivable from source, so keep what the old rollup had
+    if existing:
+        recent_activity = list(existing.get("recent_activity", []))
+    else:
+        recent_activity = [
+            {"type": "project_created", "project_id": p["id"], "title": p["title"], "at": p["created_at"]}
+            for p in recent_projects
+        ]
+    if activity:
+        recent_activity.insert(0, activity)
+    
+    rollup = {
+        "_id": user_id,
+        "user_id": user_id,
+        "total_projects": projects_collection.count_documents({"user_id": user_id}),
+        "total_tasks": sum(tasks_by_status.values()),
+        "completed_tasks": completed_tasks,
+        "tasks_by_status": dict(tasks_by_status),
+        "tasks_by_priority": dict(tasks_by_priority),
+        "recent_projects": recent_projects,
+        "recent_activity": recent_activity[:DASHBOARD_RECENT_ACTIVITY],
+        "version": (existing or {}).get("version", 0) + 1,
+        "generation": str(uuid.uuid4()),
+        "updated_at": datetime.utcnow()
+    }
+    return rollup
+
+def serialize_dashboard_rollup(rollup: dict):
+    total_tasks = rollup["total_tasks"]
+    summary = {
+        "total_projects": rollup["total_projects"],
+        "total_tasks": total_tasks,
+        "completed_tasks": rollup["completed_tasks"],
+        "overall_progress": (rollup["completed_tasks"] / total_tasks * 100) if total_tasks > 0 else 0,
+        "tasks_by_status": rollup["tasks_by_status"],
+        "tasks_by_priority": rollup["tasks_by_priority"],
+        "recent_projects": [],
+        "recent_activity": [],
+        "updated_at": rollup["updated_at"].isoformat()
+    }
+    for project in rollup["recent_projects"]:
+        project = serialize_document(dict(project))
+        project["progress"] = (project["completed_tasks"] / project["task_count"] * 100) if project["task_count"] > 0 else 0
+        summary["recent_projects"].append(project)
+    for activity in rollup["recent_activity"]:
+        summary["recent_activity"].append({**activity, "at": activity["at"].isoformat()})
+    return summary
+
+def stream_projects_ndjson(user_id: str):
+    """Yield one NDJSON line per project, with its tasks embedded"""
+    # A single aggregation cursor keeps memory flat regardless of account size
+    cursor = projects_collection.aggregate(
+        [
+            {"$match": {"user_id": user_id}},
+            {"$sort": {"created_at": 1}},
+            {"$lookup": {
+                "from": tasks_collection.name,
+                "localField": "id",
+                "foreignField": "project_id",
+                "as": "tasks"
+            }},
+            {"$project": {"_id": 0, "tasks._id": 0}}
+        ],
+        allowDiskUse=True,
+        batchSize=EXPORT_BATCH_SIZE
+    )
+    try:
+        for project in cursor:
+            for task in project["tasks"]:
+                serialize_document(task)
+            yield json.dumps(serialize_document(project)) + "\n"
+    finally:
+        cursor.close()
+
+def request_fingerprint(project: ProjectCreate) -> str:
+    return hashlib.sha256(
+        json.dumps(project.model_dump(), sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+async def claim_idempotency_key(key_id: str, fingerprint: str):
+    """Claim an idempotency key, or wait for and return the stored response.
+    
+    Returns (lease_id, None) when this request should do the work, or
+    (None, stored_response) when an earlier request already finished it.
+    """
+    deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+    while True:
+        lease_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        locked_until = now + timedelta(seconds=IDEMPOTENCY_LEASE_SECONDS)
+        try:
+            idempotency_collection.insert_one({
+                "_id": key_id,
+                "fingerprint": fingerprint,
+                "status": "in_progress",
+                "lease_id": lease_id,
+                "locked_until": locked_until,
+                "created_at": now
+            })
+            return lease_id, None
+        except DuplicateKeyError:
+            pass
+        
+        existing = idempotency_collection.find_one({"_id": key_id})
+        if existing is None:
+            # The original request failed and released the key; try to claim it again
+            continue
+        if existing["fingerprint"] != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+        if existing["status"] == "completed":
+            return None, existing["response"]
+        if existing["locked_until"] <= now:
+            # The holder died or overran its lease; only one waiter wins the takeover
+            taken = idempotency_collection.find_one_and_update(
+                {"_id": key_id, "status": "in_progress", "lease_id": existing["lease_id"]},
+                {"$set": {"lease_id": lease_id, "locked_until": locked_until}}
+            )
+            if taken is not None:
+                return lease_id, None
+            continue
+        if time.monotonic() >= deadline:
+            raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress")
+        await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+
+class LeaseRenewer(threading.Thread):
+    """Keep extending an idempotency lease while its holder is still working"""
+    def __init__(self, key_id: str, lease_id: str):
+        super().__init__(daemon=True)
+        self.key_id = key_id
+        self.lease_id = lease_id
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        # The work runs synchronously on the event loop, so renewal needs its own thread
+        interval = IDEMPOTENCY_LEASE_SECONDS / 3
+        while not self.stop_event.wait(interval):
+            try:
+                idempotency_collection.update_one(
+                    {"_id": self.key_id, "lease_id": self.lease_id, "status": "in_progress"},
+                    {"$set": {"locked_until": datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_LEASE_SECONDS)}}
+                )
+            except PyMongoError as e:
+                print(f"Idempotency lease renewal error: {e}")
+    
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+class RequestBodyStreamingResponse(StreamingResponse):
+    """StreamingResponse for iterators that read the request body themselves"""
+    async def __call__(self, scope, receive, send):
+        # StreamingResponse listens for disconnects on receive, which would swallow
+        # the request body; request.stream() raises on disconnect instead
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+async def stream_import_progress(request: Request, user_id: str):
+    """Import an NDJSON request body in chunks, yielding one progress line per chunk"""
+    imported_projects = 0
+    imported_tasks = 0
+    failed_records = 0
+    chunks_written = 0
+    line_number = 0
+    
+    pending_projects = []
+    pending_tasks = []
+    pending_lines = []
+    chunk_errors = []
+    
+    def record_error(line: int, message: str):
+        nonlocal failed_records
+        failed_records += 1
+        chunk_errors.append({"line": line, "error": message})
+    
+    def flush():
+        nonlocal imported_projects, imported_tasks, chunks_written
+        failed_lines = set()
+        if pending_projects:
+            try:
+                projects_collection.insert_many(pending_projects, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    failed_lines.add(pending_lines[write_error["index"]])
+                    record_error(pending_lines[write_error["index"]], write_error.get("errmsg", "Write failed"))
+        
+        # Only write tasks whose project made it in
+        tasks_to_insert = [
+            (task, line) for task, line in pending_tasks if line not in failed_lines
+        ]
+        if tasks_to_insert:
+            try:
+                tasks_collection.insert_many([task for task, _ in tasks_to_insert], ordered=False)
+                imported_tasks += len(tasks_to_insert)
+            except BulkWriteError as e:
+                imported_tasks += e.details.get("nInserted", 0)
+                for write_error in e.details.get("writeErrors", []):
+                    record_error(
+                        tasks_to_insert[write_error["index"]][1],
+                        write_error.get("errmsg", "Task write failed")
+                    )
+        
+        for project_doc, line in zip(pending_projects, pending_lines):
+            if line not in failed_lines:
+                similarity_index.add(project_doc["id"], project_doc["user_id"], project_doc["description"])
+        imported_projects += len(pending_projects) - len(failed_lines)
+        chunks_written += 1
+        progress = {
+            "type": "progress",
+            "chunk": chunks_written,
+            "records_read": line_number,
+            "imported_projects": imported_projects,
+            "imported_tasks": imported_tasks,
+            "failed_records": failed_records,
+            "errors": list(chunk_errors)
+        }
+        pending_projects.clear()
+        pending_tasks.clear()
+        pending_lines.clear()
+        chunk_errors.clear()
+        return json.dumps(progress) + "\n"
+    
+    def handle_line(raw_line: bytes):
+        if len(raw_line) > MAX_IMPORT_LINE_BYTES:
+            record_error(line_number, f"Line exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+            return
+        if not raw_line.strip():
+            return
+        try:
+            record = json.loads(raw_line)
+            project_doc, task_docs = build_import_documents(record, user_id)
+        except ValueError as e:
+            record_error(line_number, str(e))
+            return
+        pending_projects.append(project_doc)
+        pending_lines.append(line_number)
+        pending_tasks.extend((task, line_number) for task in task_docs)
+    
+    def chunk_full():
+        return len(pending_projects) >= IMPORT_CHUNK_SIZE or len(chunk_errors) >= IMPORT_CHUNK_SIZE
+    
+    buffer = b""
+    skipping_long_line = False
+    async for body_chunk in request.stream():
+        buffer += body_chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw_line in lines:
+            if skipping_long_line:
+                # Tail of a line that was already reported as too long
+                skipping_long_line = False
+                continue
+            line_number += 1
+            handle_line(raw_line)
+            if chunk_full():
+                yield flush()
+        if len(buffer) > MAX_IMPORT_LINE_BYTES and not skipping_long_line:
+            # Never hold more than one capped line in memory
+            line_number += 1
+            record_error(line_number, f"Line exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+            skipping_long_line = True
+        if skipping_long_line:
+            buffer = b""
+    if buffer and not skipping_long_line:
+        line_number += 1
+        handle_line(buffer)
+    if pending_projects or chunk_errors or not chunks_written:
+        yield flush()
+    
+    if imported_projects:
+        rebuild_dashboard_rollup(user_id, {
+            "type": "projects_imported",
+            "count": imported_projects,
+            "at": datetime.utcnow()
+        })
+    
+    yield json.dumps({
+        "type": "summary",
+        "records_read": line_number,
+        "imported_projects": imported_projects,
+        "imported_tasks": imported_tasks,
+        "failed_records": failed_records,
+        "chunks_written": chunks_written
+    }) + "\n"
+
 # API Routes
+@app.on_event("startup")
+def create_indexes():
+    idempotency_collection.create_index("created_at", expireAfterSeconds=IDEMPOTENCY_TTL_SECONDS)
+    # Back the tasks $lookup in exports and rollup rebuilds, and per-user project scans by date
+    tasks_collection.create_index("project_id")
+    projects_collection.create_index([("user_id", 1), ("created_at", -1)])
+
+@app.on_event("startup")
+def load_similarity_index():
+    # Backfilling can touch every project, so it must not hold up startup
+    threading.Thread(target=run_similarity_backfill, daemon=True).start()
+
+@app.on_event("shutdown")
+def save_similarity_index():
+    snapshot_similarity_index()
+
 @app.get("/")
 async def root():
     return {"message": "SaaS Blueprint Generator API", "version": "1.0.0"}
@@ -291,13 +1216,36 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
         "email": current_user["email"]
     }
 
-@app.post("/api/projects")
-async def create_project(project: ProjectCreate, current_user: dict = Depends(get_current_user)):
-    # Analyze idea with AI
-    analysis = analyze_idea_with_ai(project.description)
+def create_project_for_user(project: ProjectCreate, current_user: dict):
+    """Analyze the idea and store the project with its generated tasks"""
+    # Look for a near-duplicate of one of the user's earlier ideas
+    similar_project = None
+    source_project = None
+    # The signature is pure-Python work, so compute it once for both lookup and indexing
+    signature = similarity_index.signature(project.description)
+    match = similarity_index.find_similar(current_user["id"], signature) if signature is not None else None
+    if match:
+        source_project = projects_collection.find_one({"id": match[0], "user_id": current_user["id"]})
+    if source_project:
+        similar_project = {
+            "id": source_project["id"],
+            "title": source_project["title"],
+            "similarity": round(match[1], 3),
+            "reused": project.reuse_analysis and "analysis" in source_project
+        }
+    
+    if similar_project and similar_project["reused"]:
+        # Seed from the earlier analysis instead of calling the LLM again
+        analysis = source_project["analysis"]
+        features = source_project["features"]
+    else:
+        # Analyze idea with AI
+        analysis = analyze_idea_with_ai(project.description)
+        
+        # Extract features
+        features = extract_features_from_idea(project.description)
     
-    # Extract features and convert to tasks
-    features = extract_features_from_idea(project.description)
+    # Convert features to tasks
     tasks = convert_features_to_tasks(features)
     
     # Create project
@@ -308,12 +1256,16 @@ async def create_project(project: ProjectCreate, current_user: dict = Depends(ge
         "title": project.title,
         "description": project.description,
         "validation_scores": analysis if isinstance(analysis, dict) else {},
+        "analysis": analysis,
         "features": features,
         "status": "active",
         "created_at": datetime.utcnow()
     }
     
+    rollup_snapshot = read_dashboard_generation(current_user["id"])
     projects_collection.insert_one(project_doc)
+    if signature is not None:
+        similarity_index.add_signature(project_id, current_user["id"], signature)
     
     # Create tasks for the project
     for task in tasks:
@@ -329,6 +1281,30 @@ async def create_project(project: ProjectCreate, current_user: dict = Depends(ge
         }
         tasks_collection.insert_one(task_doc)
     
+    update_dashboard_rollup(
+        current_user["id"],
+        rollup_snapshot,
+        {
+            "$inc": {
+                "total_projects": 1,
+                "total_tasks": len(tasks),
+                f"tasks_by_status.{rollup_key('To Do')}": len(tasks),
+                **{
+                    f"tasks_by_priority.{rollup_key(priority)}": count
+                    for priority, count in Counter(task["priority"] for task in tasks).items()
+                }
+            },
+            "$push": {
+                "recent_projects": {
+                    "$each": [recent_project_summary(project_doc, len(tasks), 0)],
+                    "$position": 0,
+                    "$slice": DASHBOARD_RECENT_PROJECTS
+                }
+            }
+        },
+        activity_entry("project_created", project_doc)
+    )
+    
     return {
         "project": {
             "id": project_doc["id"],
@@ -341,9 +1317,45 @@ async def create_project(project: ProjectCreate, current_user: dict = Depends(ge
             "created_at": project_doc["created_at"].isoformat()
         },
         "analysis": analysis,
-        "tasks_created": len(tasks)
+        "tasks_created": len(tasks),
+        "similar_project": similar_project
     }
 
+@app.post("/api/projects")
+async def create_project(
+    project: ProjectCreate,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None)
+):
+    if not idempotency_key:
+        return create_project_for_user(project, current_user)
+    
+    # Retries with the same key replay the stored result instead of re-running the LLM
+    key_id = f"{current_user['id']}:{idempotency_key}"
+    lease_id, stored_response = await claim_idempotency_key(key_id, request_fingerprint(project))
+    if stored_response is not None:
+        response.headers["Idempotent-Replayed"] = "true"
+        return stored_response
+    
+    # Writes are conditional on the lease, so a request whose lease was taken over leaves the key alone
+    renewer = LeaseRenewer(key_id, lease_id)
+    renewer.start()
+    try:
+        result = create_project_for_user(project, current_user)
+    except Exception:
+        # Let a retry run the request again
+        idempotency_collection.delete_one({"_id": key_id, "status": "in_progress", "lease_id": lease_id})
+        raise
+    finally:
+        renewer.stop()
+    
+    idempotency_collection.update_one(
+        {"_id": key_id, "lease_id": lease_id},
+        {"$set": {"status": "completed", "response": result}, "$unset": {"locked_until": ""}}
+    )
+    return result
+
 @app.get("/api/projects")
 async def get_user_projects(current_user: dict = Depends(get_current_user)):
     projects = list(projects_collection.find({"user_id": current_user["id"]}))
@@ -363,6 +1375,21 @@ async def get_user_projects(current_user: dict = Depends(get_current_user)):
     
     return {"projects": projects}
 
+@app.get("/api/projects/export")
+async def export_projects(current_user: dict = Depends(get_current_user)):
+    return StreamingResponse(
+        stream_projects_ndjson(current_user["id"]),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="projects.ndjson"'}
+    )
+
+@app.post("/api/projects/import")
+async def import_projects(request: Request, current_user: dict = Depends(get_current_user)):
+    return RequestBodyStreamingResponse(
+        stream_import_progress(request, current_user["id"]),
+        media_type="application/x-ndjson"
+    )
+
 @app.get("/api/projects/{project_id}")
 async def get_project(project_id: str, current_user: dict = Depends(get_current_user)):
     project = projects_collection.find_one({"id": project_id, "user_id": current_user["id"]})
@@ -416,7 +1443,22 @@ async def create_task(project_id: str, task: TaskCreate, current_user: dict = De
         "created_at": datetime.utcnow()
     }
     
+    rollup_snapshot = read_dashboard_generation(current_user["id"])
     tasks_collection.insert_one(task_doc)
+    update_dashboard_rollup(
+        current_user["id"],
+        rollup_snapshot,
+        {
+            "$inc": {
+                "total_tasks": 1,
+                f"tasks_by_status.{rollup_key(task_doc['status'])}": 1,
+                f"tasks_by_priority.{rollup_key(task_doc['priority'])}": 1,
+                "recent_projects.$[project].task_count": 1
+            }
+        },
+        activity_entry("task_created", project, task_title=task.title),
+        array_filters=[{"project.id": project_id}]
+    )
     task_doc.pop("_id", None)
     if "created_at" in task_doc:
         task_doc["created_at"] = task_doc["created_at"].isoformat()
@@ -435,11 +1477,32 @@ async def update_task(task_id: str, task_update: TaskUpdate, current_user: dict
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Update task
+    rollup_snapshot = read_dashboard_generation(current_user["id"])
     tasks_collection.update_one(
         {"id": task_id},
         {"$set": {"status": task_update.status}}
     )
     
+    old_status = task.get("status")
+    if old_status != task_update.status:
+        done_delta = (task_update.status == "Done") - (old_status == "Done")
+        status_changes = {}
+        # Distinct statuses can share a rollup key, and both $inc paths would then collide
+        if rollup_key(old_status) != rollup_key(task_update.status):
+            status_changes[f"tasks_by_status.{rollup_key(old_status)}"] = -1
+            status_changes[f"tasks_by_status.{rollup_key(task_update.status)}"] = 1
+        if done_delta:
+            status_changes["completed_tasks"] = done_delta
+            status_changes["recent_projects.$[project].completed_tasks"] = done_delta
+        update_dashboard_rollup(
+            current_user["id"],
+            rollup_snapshot,
+            {"$inc": status_changes},
+            activity_entry("task_status_changed", project, task_title=task["title"], status=task_update.status),
+            # MongoDB rejects array filters the update does not reference
+            array_filters=[{"project.id": project["id"]}] if done_delta else None
+        )
+    
     # Get updated task
     updated_task = tasks_collection.find_one({"id": task_id})
     updated_task.pop("_id", None)
@@ -490,6 +1553,18 @@ async def get_project_flow(project_id: str, current_user: dict = Depends(get_cur
         ] + [f"{feature.title()} Page" for feature in features[:3]]
     }
 
+@app.get("/api/dashboard/summary")
+async def get_dashboard_summary(current_user: dict = Depends(get_current_user)):
+    rollup = dashboard_rollups_collection.find_one({"_id": current_user["id"]})
+    if rollup is None:
+        rollup = rebuild_dashboard_rollup(current_user["id"])
+    return {"summary": serialize_dashboard_rollup(rollup)}
+
+@app.post("/api/dashboard/summary/rebuild")
+async def rebuild_dashboard_summary(current_user: dict = Depends(get_current_user)):
+    rollup = rebuild_dashboard_rollup(current_user["id"])
+    return {"summary": serialize_dashboard_rollup(rollup)}
+
 @app.get("/api/assistant/suggestion")
 async def get_ai_suggestion(current_user: dict = Depends(get_current_user)):
     # Get user's latest project
@@ -527,5 +1602,15 @@ async def get_ai_suggestion(current_user: dict = Depends(get_current_user)):
         ]
     }
 
+@app.get("/api/admin/slow-requests")
+async def get_slow_requests(limit: int = 20, _: None = Depends(require_admin)):
+    # Most recent first
+    recent = list(slow_requests)[::-1][:max(0, limit)]
+    return {
+        "slow_requests": recent,
+        "threshold_ms": SLOW_REQUEST_MS,
+        "sample_rate": PROFILE_SAMPLE_RATE
+    }
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
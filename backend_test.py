@@ -1,5 +1,7 @@
 import requests
 import unittest
+import json
+import os
 import uuid
 import time
 from datetime import datetime
@@ -208,6 +210,173 @@ class SaaSBlueprintAPITest(unittest.TestCase):
         self.assertIn("suggestion", data)
         print("✅ Get AI suggestion test passed")
 
+    def test_13_export_projects(self):
+        """Test streaming NDJSON project export"""
+        print("\n🔍 Testing project export...")
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(
+            f"{self.base_url}/api/projects/export",
+            headers=headers,
+            stream=True
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers["content-type"])
+        for line in response.iter_lines():
+            if line:
+                record = json.loads(line)
+                self.assertIn("id", record)
+                self.assertIn("tasks", record)
+        print("✅ Project export test passed")
+
+    def test_14_import_projects(self):
+        """Test chunked NDJSON project import"""
+        print("\n🔍 Testing project import...")
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/x-ndjson"
+        }
+        records = [
+            json.dumps({
+                "title": "Imported Project",
+                "description": "A dashboard for tracking team metrics",
+                "tasks": [{"title": "Create main dashboard", "priority": "High"}]
+            }),
+            "not valid json",
+            json.dumps({"title": "Numeric Description", "description": 123}),
+            json.dumps({
+                "title": "Bad Task",
+                "description": "A project with an invalid task",
+                "tasks": [{"title": "Task", "status": 1}]
+            })
+        ]
+        response = requests.post(
+            f"{self.base_url}/api/projects/import",
+            data="\n".join(records),
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        progress = [line for line in lines if line["type"] == "progress"]
+        summary = lines[-1]
+        self.assertTrue(len(progress) > 0)
+        self.assertEqual(summary["type"], "summary")
+        self.assertEqual(summary["imported_projects"], 1)
+        self.assertEqual(summary["imported_tasks"], 1)
+        self.assertEqual(summary["failed_records"], 3)
+        errors = [error for line in progress for error in line["errors"]]
+        self.assertEqual([error["line"] for error in errors], [2, 3, 4])
+        print("✅ Project import test passed")
+
+    def test_15_slow_requests_requires_admin(self):
+        """Test that the slow request log is admin only"""
+        print("\n🔍 Testing slow request log access...")
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(
+            f"{self.base_url}/api/admin/slow-requests",
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 403)
+        print("✅ Slow request log access test passed")
+
+    def test_16_idempotent_project_creation(self):
+        """Test that retried project creation replays the first response"""
+        print("\n🔍 Testing idempotent project creation...")
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Idempotency-Key": str(uuid.uuid4())
+        }
+        project_data = {
+            "title": "Invoice Automation",
+            "description": "Automated invoicing with payment reminders and a billing dashboard."
+        }
+        first = requests.post(f"{self.base_url}/api/projects", json=project_data, headers=headers)
+        retry = requests.post(f"{self.base_url}/api/projects", json=project_data, headers=headers)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.headers.get("Idempotent-Replayed"), "true")
+        self.assertEqual(retry.json()["project"]["id"], first.json()["project"]["id"])
+        
+        project_data["title"] = "Different Project"
+        mismatch = requests.post(f"{self.base_url}/api/projects", json=project_data, headers=headers)
+        self.assertEqual(mismatch.status_code, 422)
+        print("✅ Idempotent project creation test passed")
+
+    def test_17_similar_project_reuse(self):
+        """Test that a paraphrased idea reuses the earlier analysis"""
+        print("\n🔍 Testing similar idea detection...")
+        headers = {"Authorization": f"Bearer {self.token}"}
+        original = {
+            "title": "Recipe Planner",
+            "description": "A meal planning app that suggests weekly recipes, builds shopping lists and sends grocery reminders."
+        }
+        paraphrase = {
+            "title": "Recipe Planner Again",
+            "description": "A meal planning app which suggests weekly recipes, builds shopping lists, and sends grocery reminders!"
+        }
+        first = requests.post(f"{self.base_url}/api/projects", json=original, headers=headers)
+        second = requests.post(f"{self.base_url}/api/projects", json=paraphrase, headers=headers)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        similar_project = second.json()["similar_project"]
+        self.assertIsNotNone(similar_project)
+        self.assertEqual(similar_project["id"], first.json()["project"]["id"])
+        self.assertTrue(similar_project["reused"])
+        print("✅ Similar idea detection test passed")
+
+    def test_18_dashboard_summary(self):
+        """Test the dashboard rollup summary"""
+        print("\n🔍 Testing dashboard summary...")
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(
+            f"{self.base_url}/api/dashboard/summary",
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        summary = response.json()["summary"]
+        for field in ["total_projects", "total_tasks", "completed_tasks", "overall_progress",
+                      "tasks_by_status", "tasks_by_priority", "recent_projects", "recent_activity"]:
+            self.assertIn(field, summary)
+        
+        rebuilt = requests.post(
+            f"{self.base_url}/api/dashboard/summary/rebuild",
+            headers=headers
+        ).json()["summary"]
+        self.assertEqual(rebuilt["total_projects"], summary["total_projects"])
+        self.assertEqual(rebuilt["total_tasks"], summary["total_tasks"])
+        self.assertEqual(rebuilt["completed_tasks"], summary["completed_tasks"])
+        print("✅ Dashboard summary test passed")
+
+    def test_19_profiled_request_capture(self):
+        """Test that a request sent with X-Profile is captured with its spans"""
+        print("\n🔍 Testing profiled request capture...")
+        admin_token = os.getenv("ADMIN_TOKEN")
+        if not admin_token:
+            print("⚠️ ADMIN_TOKEN not set, skipping test")
+            return
+            
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "X-Profile": admin_token
+        }
+        response = requests.get(
+            f"{self.base_url}/api/user/profile",
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        profile_id = response.headers.get("X-Profile-Id")
+        self.assertIsNotNone(profile_id)
+        
+        response = requests.get(
+            f"{self.base_url}/api/admin/slow-requests",
+            headers={"X-Admin-Token": admin_token}
+        )
+        self.assertEqual(response.status_code, 200)
+        entries = [entry for entry in response.json()["slow_requests"] if entry["id"] == profile_id]
+        self.assertEqual(len(entries), 1)
+        self.assertIn("auth", entries[0]["span_totals"])
+        self.assertIn("serialize", entries[0]["span_totals"])
+        print("✅ Profiled request capture test passed")
+
 if __name__ == "__main__":
     # Run tests in order
     test_suite = unittest.TestSuite()
@@ -223,6 +392,13 @@ if __name__ == "__main__":
     test_suite.addTest(SaaSBlueprintAPITest('test_10_update_task'))
     test_suite.addTest(SaaSBlueprintAPITest('test_11_get_project_flow'))
     test_suite.addTest(SaaSBlueprintAPITest('test_12_get_ai_suggestion'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_13_export_projects'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_14_import_projects'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_15_slow_requests_requires_admin'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_16_idempotent_project_creation'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_17_similar_project_reuse'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_18_dashboard_summary'))
+    test_suite.addTest(SaaSBlueprintAPITest('test_19_profiled_request_capture'))
     
     runner = unittest.TextTestRunner(verbosity=2)
     runner.run(test_suite)
\ No newline at end of file
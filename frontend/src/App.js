@@ -674,22 +674,22 @@ const DashboardLayout = ({ children }) => {
 };
 
 const Dashboard = () => {
-  const [projects, setProjects] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [suggestion, setSuggestion] = useState(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    fetchProjects();
+    fetchSummary();
     fetchSuggestion();
   }, []);
 
-  const fetchProjects = async () => {
+  const fetchSummary = async () => {
     try {
-      const response = await axios.get('/api/projects');
-      setProjects(response.data.projects);
+      const response = await axios.get('/api/dashboard/summary');
+      setSummary(response.data.summary);
     } catch (error) {
-      console.error('Error fetching projects:', error);
-      toast.error('Failed to load projects');
+      console.error('Error fetching dashboard summary:', error);
+      toast.error('Failed to load dashboard');
     } finally {
       setLoading(false);
     }
@@ -704,9 +704,10 @@ const Dashboard = () => {
     }
   };
 
-  const totalTasks = projects.reduce((sum, project) => sum + project.task_count, 0);
-  const completedTasks = projects.reduce((sum, project) => sum + project.completed_tasks, 0);
-  const overallProgress = totalTasks > 0 ? (completedTasks / totalTasks) * 100 : 0;
+  const totalProjects = summary?.total_projects || 0;
+  const completedTasks = summary?.completed_tasks || 0;
+  const overallProgress = summary?.overall_progress || 0;
+  const recentProjects = summary?.recent_projects || [];
 
   if (loading) {
     return (
@@ -737,7 +738,7 @@ const Dashboard = () => {
               </div>
               <div className="ml-4">
                 <p className="text-sm font-medium text-gray-500">Total Projects</p>
-                <p className="text-2xl font-semibold text-gray-900">{projects.length}</p>
+                <p className="text-2xl font-semibold text-gray-900">{totalProjects}</p>
               </div>
             </div>
           </div>
@@ -802,7 +803,7 @@ const Dashboard = () => {
             </button>
           </div>
           
-          {projects.length === 0 ? (
+          {recentProjects.length === 0 ? (
             <div className="text-center py-8">
               <FileText className="w-16 h-16 text-gray-300 mx-auto mb-4" />
               <h3 className="text-lg font-medium text-gray-900 mb-2">No projects yet</h3>
@@ -817,7 +818,7 @@ const Dashboard = () => {
             </div>
           ) : (
             <div className="space-y-4">
-              {projects.slice(0, 3).map((project) => (
+              {recentProjects.slice(0, 3).map((project) => (
                 <div key={project.id} className="flex items-center justify-between p-4 bg-gray-50 rounded-lg">
                   <div className="flex-1">
                     <h3 className="font-semibold text-gray-900">{project.title}</h3>